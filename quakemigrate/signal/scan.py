@@ -301,9 +301,7 @@ class QuakeScan:
         if starttime > endtime:
             raise util.TimeSpanException
 
-        logging.info(util.log_spacer)
-        logging.info("\tDETECT - Continuous coalescence scan")
-        logging.info(util.log_spacer)
+        util.log_banner("\tDETECT - Continuous coalescence scan")
         logging.info(f"\n\tScanning from {starttime} to {endtime}\n")
         logging.info(self)
         logging.info(self.onset)
@@ -345,9 +343,7 @@ class QuakeScan:
         if (starttime is None) ^ (endtime is None):
             raise RuntimeError("Must supply a starttime AND an endtime.")
 
-        logging.info(util.log_spacer)
-        logging.info("\tLOCATE - Determining event location and uncertainty")
-        logging.info(util.log_spacer)
+        util.log_banner("\tLOCATE - Determining event location and uncertainty")
         if trigger_file is not None:
             logging.info(f"\n\tLocating events in {trigger_file}")
         else:
@@ -466,9 +462,7 @@ class QuakeScan:
             event = Event(self.marginal_window, triggered_event)
             w_beg = event.trigger_time - 2 * self.marginal_window - self.pre_pad
             w_end = event.trigger_time + 2 * self.marginal_window + self.post_pad
-            logging.info(util.log_spacer)
-            logging.info(f"\tEVENT - {i+1} of {n_events} - {event.uid}")
-            logging.info(util.log_spacer)
+            util.log_banner(f"\tEVENT - {i+1} of {n_events} - {event.uid}")
 
             try:
                 logging.info("\tReading waveform data...")
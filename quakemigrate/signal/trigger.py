@@ -257,9 +257,7 @@ class Trigger:
         if starttime > endtime:
             raise util.TimeSpanException
 
-        logging.info(util.log_spacer)
-        logging.info("\tTRIGGER - Triggering events from .scanmseed")
-        logging.info(util.log_spacer)
+        util.log_banner("\tTRIGGER - Triggering events from .scanmseed")
         logging.info(f"\n\tTriggering events from {starttime} to {endtime}\n")
         logging.info(self)
         logging.info(util.log_spacer)
@@ -11,11 +11,12 @@ Module that supplies various utility functions and classes.
 """
 
 import logging
+import math
 import sys
 import time
 import warnings
 from datetime import datetime
-from functools import wraps
+from functools import lru_cache, wraps
 from itertools import tee
 
 import matplotlib.ticker as ticker
@@ -25,6 +26,9 @@ from obspy import Trace, Stream
 
 log_spacer = "=" * 110
 
+# Handlers installed on the root logger by logger()
+_log_handlers = []
+
 
 def make_directories(run, subdir=None):
     """
@@ -39,11 +43,9 @@ def make_directories(run, subdir=None):
 
     """
 
-    run.mkdir(exist_ok=True)
-
-    if subdir:
-        new_dir = run / subdir
-        new_dir.mkdir(exist_ok=True, parents=True)
+    # Creating the subdir with parents=True also creates the run directory
+    new_dir = run / subdir if subdir else run
+    new_dir.mkdir(exist_ok=True, parents=True)
 
 
 def gaussian_1d(x, a, b, c):
@@ -68,15 +70,29 @@ def gaussian_1d(x, a, b, c):
 
     """
 
-    f = a * np.exp(-1.0 * ((x - b) ** 2) / (2 * (c**2)))
+    # Work in place on a single array, at the shape parameters and x broadcast to,
+    # rather than allocating a new temporary array at each step of the calculation
+    x = np.asarray(x)
+    a, b, c = (p if np.isscalar(p) else np.asarray(p) for p in (a, b, c))
+    f = np.empty(np.broadcast(x, a, b, c).shape, dtype=np.result_type(x, a, b, c, 1.0))
+    np.subtract(x, b, out=f)
+    np.square(f, out=f)
+    f *= -0.5 / np.square(c)
+    np.exp(f, out=f)
+    f *= a
 
-    return f
+    # Return a scalar, rather than a 0-d array, for scalar input
+    return f[()]
 
 
-def gaussian_3d(nx, ny, nz, sgm):
+def gaussian_3d(nx, ny, nz, sgm, dtype=np.float32):
     """
     Create a 3-dimensional Gaussian function.
 
+    The same few smoothing kernels are requested repeatedly over the course of a run,
+    so results are cached and shared between calls. The returned array is therefore
+    read-only - take a copy if it needs to be modified.
+
     Parameters
     ----------
     nx : array-like
@@ -87,35 +103,103 @@ def gaussian_3d(nx, ny, nz, sgm):
         Array of z values.
     sgm : float / int
         Sigma (width of gaussian in all directions).
+    dtype : `numpy.dtype`, optional
+        Floating point precision of the output. Single precision (default) is ample for
+        smoothing the coalescence map and halves the memory footprint.
 
     Returns
     -------
     f : function
-        3-dimensional Gaussian function
+        3-dimensional Gaussian function (read-only).
+
+    """
+
+    if np.isscalar(sgm):
+        sgm = np.repeat(sgm, 3)
+    sgm = tuple(np.asarray(sgm, dtype=float).tolist())
 
+    # Hand out a view - unlike the cached array itself, it cannot be made writeable
+    return _gaussian_3d(int(nx), int(ny), int(nz), sgm, np.dtype(dtype)).view()
+
+
+def gaussian_kernels_1d(nx, ny, nz, sgm, dtype=np.float32):
     """
+    Create the 1-dimensional Gaussian kernels along each axis of a 3-D grid.
+
+    The 3-D Gaussian is separable, so convolving a volume with it is equivalent to
+    convolving with each of these 1-D kernels in turn along the corresponding axis, e.g.
+    with three successive calls to `scipy.ndimage.convolve1d`. This scales with the sum,
+    rather than the product, of the kernel lengths.
+
+    Parameters
+    ----------
+    nx : int
+        Number of grid nodes along the x axis.
+    ny : int
+        Number of grid nodes along the y axis.
+    nz : int
+        Number of grid nodes along the z axis.
+    sgm : float / int or array-like
+        Sigma (width of gaussian in all directions, or along each of x, y and z).
+    dtype : `numpy.dtype`, optional
+        Floating point precision of the output. Default: single precision.
 
-    nx2 = (nx - 1) / 2
-    ny2 = (ny - 1) / 2
-    nz2 = (nz - 1) / 2
-    x = np.linspace(-nx2, nx2, nx)
-    y = np.linspace(-ny2, ny2, ny)
-    z = np.linspace(-nz2, nz2, nz)
-    ix, iy, iz = np.meshgrid(x, y, z, indexing="ij")
+    Returns
+    -------
+    gx, gy, gz : `numpy.ndarray`
+        Normalised (unit sum) 1-D Gaussian kernels along the x, y and z axes.
+
+    """
 
     if np.isscalar(sgm):
         sgm = np.repeat(sgm, 3)
-    sx, sy, sz = sgm
 
-    f = np.exp(
-        -(ix * ix) / (2 * sx * sx)
-        - (iy * iy) / (2 * sy * sy)
-        - (iz * iz) / (2 * sz * sz)
-    )
+    kernels = []
+    for n, s in zip((nx, ny, nz), sgm):
+        g = _gaussian_profile(int(n), float(s), np.dtype(dtype))
+        kernels.append(g / g.sum())
+
+    return tuple(kernels)
+
+
+@lru_cache(maxsize=32)
+def _gaussian_3d(nx, ny, nz, sgm, dtype):
+    """Build a read-only 3-D Gaussian - see :func:`gaussian_3d`."""
+
+    # The Gaussian is separable, G(x, y, z) = G(x)G(y)G(z), so only evaluate the
+    # exponential along each axis. The profiles are cached, so for the usual isotropic
+    # case axes of equal length share a single profile.
+    gx, gy, gz = (_gaussian_profile(n, s, dtype) for n, s in zip((nx, ny, nz), sgm))
+
+    # Write the product straight into the output array - the only temporary is the
+    # (nx, ny) plane of gx * gy
+    f = np.empty((nx, ny, nz), dtype=dtype)
+    np.multiply(gx[:, None, None] * gy[None, :, None], gz, out=f)
+
+    # Cached result is shared between callers, so protect it from modification
+    f.flags.writeable = False
 
     return f
 
 
+@lru_cache(maxsize=32)
+def _gaussian_profile(n, sgm, dtype):
+    """
+    Build a read-only, unnormalised 1-D Gaussian profile across n grid nodes, centred on
+    the middle of the grid.
+
+    """
+
+    n2 = (n - 1) / 2
+    x = np.linspace(-n2, n2, n).astype(dtype, copy=False)
+    sgm = dtype.type(sgm)
+
+    g = np.exp(-x * x / (2 * sgm * sgm))
+    g.flags.writeable = False
+
+    return g
+
+
 def logger(logstem, log, loglevel="info"):
     """
     Simple logger that will output to both a log file and stdout.
@@ -135,18 +219,42 @@ def logger(logstem, log, loglevel="info"):
 
     level = logging.DEBUG if loglevel == "debug" else logging.INFO
 
+    handlers = [logging.StreamHandler(sys.stdout)]
     if log:
         now = datetime.now().strftime("%Y-%m-%d_%H-%M-%S")
         logfile = logstem.parent / f"{logstem.name}_{now}"
         logfile.parent.mkdir(exist_ok=True, parents=True)
-        handlers = [
-            logging.FileHandler(str(logfile.with_suffix(".log"))),
-            logging.StreamHandler(sys.stdout),
-        ]
-    else:
-        handlers = [logging.StreamHandler(sys.stdout)]
+        # Delay opening the log file until the first message is written
+        handlers.insert(
+            0, logging.FileHandler(str(logfile.with_suffix(".log")), delay=True)
+        )
 
-    logging.basicConfig(level=level, format="%(message)s", handlers=handlers)
+    # Replace, rather than add to, any handlers installed by a previous call - e.g.
+    # when running detect then locate in the same session
+    root = logging.getLogger()
+    for handler in _log_handlers:
+        root.removeHandler(handler)
+        handler.close()
+    formatter = logging.Formatter("%(message)s")
+    for handler in handlers:
+        handler.setFormatter(formatter)
+        root.addHandler(handler)
+    root.setLevel(level)
+    _log_handlers[:] = handlers
+
+
+def log_banner(title):
+    """
+    Log a title, framed above and below by the log spacer.
+
+    Parameters
+    ----------
+    title : str
+        Title to display in the banner.
+
+    """
+
+    logging.info("%s\n%s\n%s", log_spacer, title, log_spacer)
 
 
 def time2sample(time, sampling_rate):
@@ -155,21 +263,29 @@ def time2sample(time, sampling_rate):
 
     Parameters
     ----------
-    time : float
-        Time to convert.
+    time : float or array-like
+        Time(s) to convert.
     sampling_rate : int
         Sampling rate of input data/sampling rate at which to compute the coalescence
         function.
 
     Returns
     -------
-    out : int
-        Time that correpsonds to an integer number of samples at a specific sampling
+    out : int or `numpy.ndarray` of int
+        Time(s) that correpsonds to an integer number of samples at a specific sampling
         rate.
 
     """
 
-    return int(round(time * int(sampling_rate)))
+    if type(sampling_rate) is not int:
+        sampling_rate = int(sampling_rate)
+
+    if np.isscalar(time):
+        # round() on a Python float already returns an int (rounding half to even)
+        return round(float(time) * sampling_rate)
+
+    # np.rint also rounds half to even, so matches the scalar case
+    return np.rint(np.asarray(time, dtype=float) * sampling_rate).astype(np.int64)
 
 
 def calculate_mad(x, scale=1.4826):
@@ -207,6 +323,54 @@ def calculate_mad(x, scale=1.4826):
     return scale * mad
 
 
+def squared_euclidean(x, y):
+    """
+    Calculate the squared Euclidean distance between two vectors.
+
+    Parameters
+    ----------
+    x : array-like
+        First vector, shape(n,).
+    y : array-like
+        Second vector, shape(n,).
+
+    Returns
+    -------
+    distance : float
+        Squared Euclidean distance between x and y.
+
+    """
+
+    # Only one temporary (the difference) - the sum of squares is computed as a dot
+    # product
+    diff = np.subtract(x, y)
+
+    return np.dot(diff, diff)
+
+
+def squared_euclidean_batch(X, y):
+    """
+    Calculate the squared Euclidean distance between each row of an array and a vector.
+
+    Parameters
+    ----------
+    X : array-like
+        Array of vectors, shape(m, n).
+    y : array-like
+        Vector from which to measure the distances, shape(n,).
+
+    Returns
+    -------
+    distances : `numpy.ndarray`
+        Squared Euclidean distance between each row of X and y, shape(m,).
+
+    """
+
+    diff = np.subtract(X, y)
+
+    return np.einsum("ij,ij->i", diff, diff)
+
+
 class DateFormatter(ticker.Formatter):
     """
     Extend the `matplotlib.ticker.Formatter` class to allow for millisecond precision
@@ -245,28 +409,42 @@ class DateFormatter(ticker.Formatter):
         return dt.strftime(self.fmt).format(ms=ms)
 
 
-def trim2sample(time, sampling_rate):
+def trim2sample(time, sampling_rate, quantize_ms=False):
     """
     Utility function to ensure time padding results in a time that is an integer number
     of samples.
 
     Parameters
     ----------
-    time : float
-        Time to trim.
+    time : float or array-like
+        Time(s) to trim.
     sampling_rate : int
         Sampling rate of input data/sampling rate at which to compute the coalescence
         function.
+    quantize_ms : bool, optional
+        Whether to additionally truncate the output to millisecond precision. Note
+        that, for sampling rates above 1 kHz, the result may then no longer correspond
+        to an integer number of samples. Default: False.
 
     Returns
     -------
-    out : int
-        Time that correpsonds to an integer number of samples at a specific sampling
+    out : float or `numpy.ndarray` of float
+        Time(s) that correpsonds to an integer number of samples at a specific sampling
         rate.
 
     """
 
-    return int(np.ceil(time * sampling_rate) / sampling_rate * 1000) / 1000
+    if np.isscalar(time):
+        out = math.ceil(time * sampling_rate) / sampling_rate
+        if quantize_ms:
+            out = int(out * 1000) / 1000
+        return out
+
+    out = np.ceil(np.asarray(time, dtype=float) * sampling_rate) / sampling_rate
+    if quantize_ms:
+        out = np.trunc(out * 1000) / 1000
+
+    return out
 
 
 def wa_response(convert="DIS2DIS", obspy_def=True):
@@ -651,17 +829,24 @@ def pairwise(iterable):
 def timeit(*args_, **kwargs_):
     """Function wrapper that measures the time elapsed during its execution."""
 
+    if not args_:
+        level = logging.DEBUG
+    elif args_[0] == "info":
+        level = logging.INFO
+    else:
+        # Any other argument (e.g. "debug") has never produced a timing message
+        return lambda func: func
+    msg = " " * 21 + "Elapsed time: %6f seconds."
+
     def inner_function(func):
         @wraps(func)
         def wrapper(*args, **kwargs):
-            ts = time.time()
+            # Skip the timing entirely if the message would not be emitted
+            if not logging.getLogger().isEnabledFor(level):
+                return func(*args, **kwargs)
+            ts = time.perf_counter_ns()
             result = func(*args, **kwargs)
-            msg = " " * 21 + f"Elapsed time: {time.time() - ts:6f} seconds."
-            try:
-                if args_[0] == "info":
-                    logging.info(msg)
-            except IndexError:
-                logging.debug(msg)
+            logging.log(level, msg, (time.perf_counter_ns() - ts) * 1e-9)
             return result
 
         return wrapper
@@ -669,226 +854,270 @@ def timeit(*args_, **kwargs_):
     return inner_function
 
 
-class StationFileHeaderException(Exception):
+class QMigrateError(Exception):
+    """
+    Base class for the custom QuakeMigrate exceptions.
+
+    Subclasses define their error message as a class-level template, `MESSAGE`, which
+    is formatted with the arguments passed to the subclass constructor.
+    Formatting is deferred until the exception is printed, so exceptions that are
+    caught and discarded (e.g. when skipping traces) never pay for it.
+
+    """
+
+    MESSAGE = ""
+
+    def __str__(self):
+        return self.MESSAGE.format(*self.args)
+
+
+class StationFileHeaderException(QMigrateError):
     """Custom exception to handle incorrect header columns in station file."""
 
+    MESSAGE = (
+        "Incorrect station file header - use:\nLatitude, Longitude, Elevation, Name"
+    )
+
     def __init__(self):
-        super().__init__(
-            "Incorrect station file header - use:\nLatitude, Longitude, Elevation, Name"
-        )
+        super().__init__()
 
 
-class InvalidVelocityModelHeader(Exception):
+class InvalidVelocityModelHeader(QMigrateError):
     """Custom exception to handle incorrect header columns in station file."""
 
+    MESSAGE = "Must include at least '{}' in header."
+
     def __init__(self, key):
-        super().__init__(f"Must include at least '{key}' in header.")
+        super().__init__(key)
 
 
-class ArchiveFormatException(Exception):
+class ArchiveFormatException(QMigrateError):
     """Custom exception to handle case where Archive.format is not set."""
 
+    MESSAGE = (
+        "Archive format has not been set. Set when making the Archive object with "
+        "the kwarg 'archive_format=<path_structure>', or afterwards with the "
+        "command 'Archive.path_structure(<path_structure>)'.\nTo set a custom "
+        "format, use 'Archive.format = "
+        "custom/archive_{{year}}_{{jday}}/{{day:02d}}.{{station}}_structure'."
+    )
+
     def __init__(self):
-        super().__init__(
-            "Archive format has not been set. Set when making the Archive object with "
-            "the kwarg 'archive_format=<path_structure>', or afterwards with the "
-            "command 'Archive.path_structure(<path_structure>)'.\nTo set a custom "
-            "format, use 'Archive.format = "
-            "custom/archive_{year}_{jday}/{day:02d}.{station}_structure'."
-        )
+        super().__init__()
 
 
-class ArchivePathStructureError(Exception):
+class ArchivePathStructureError(QMigrateError):
     """
     Custom exception to handle case where an invalid Archive path structure is selected.
     """
 
+    MESSAGE = (
+        "The archive path structure you have selected: '{}' is not "
+        "a valid option! See the documentation for "
+        "'quakemigrate.data.Archive.path_structure' for a complete list, or specify"
+        " a custom format with 'Archive.format = "
+        "custom/archive_{{year}}_{{jday}}/{{day:02d}}.{{station}}_structure'."
+    )
+
     def __init__(self, archive_format):
-        super().__init__(
-            f"The archive path structure you have selected: '{archive_format}' is not "
-            "a valid option! See the documentation for "
-            "'quakemigrate.data.Archive.path_structure' for a complete list, or specify"
-            " a custom format with 'Archive.format = "
-            "custom/archive_{year}_{jday}/{day:02d}.{station}_structure'."
-        )
+        super().__init__(archive_format)
 
 
-class ArchiveEmptyException(Exception):
+class ArchiveEmptyException(QMigrateError):
     """Custom exception to handle empty archive."""
 
-    def __init__(self):
-        super().__init__("No data was available for this timestep.")
+    MESSAGE = "No data was available for this timestep."
+    # Additional message printed to log
+    msg = "\t\tNo files found in archive for this time period."
 
-        # Additional message printed to log
-        self.msg = "\t\tNo files found in archive for this time period."
+    def __init__(self):
+        super().__init__()
 
 
-class NoScanMseedDataException(Exception):
+class NoScanMseedDataException(QMigrateError):
     """
     Custom exception to handle case when no .scanmseed files can be found by
     read_coastream().
     """
 
+    MESSAGE = "No .scanmseed data found."
+
     def __init__(self):
-        super().__init__("No .scanmseed data found.")
+        super().__init__()
 
 
-class NoStationAvailabilityDataException(Exception):
+class NoStationAvailabilityDataException(QMigrateError):
     """
     Custom exception to handle case when no .StationAvailability files can be found by
     read_availability().
     """
 
+    MESSAGE = "No .StationAvailability files found."
+
     def __init__(self):
-        super().__init__("No .StationAvailability files found.")
+        super().__init__()
 
 
-class DataAvailabilityException(Exception):
+class DataAvailabilityException(QMigrateError):
     """
     Custom exception to handle case when all data for the selected stations did not pass
     the data quality criteria specified by the user.
     """
 
-    def __init__(self):
-        super().__init__(
-            "All data for this timestep did not pass the specified data quality "
-            "criteria."
-        )
+    MESSAGE = (
+        "All data for this timestep did not pass the specified data quality criteria."
+    )
+    # Additional message printed to log
+    msg = (
+        "\t\tAll data for this timestep failed to pass the"
+        "\n\t\tspecified data quality criteria. This includes the"
+        "\n\t\tpresence of gaps or overlaps, or the data not"
+        "\n\t\tspanning the full time window."
+    )
 
-        # Additional message printed to log
-        self.msg = (
-            "\t\tAll data for this timestep failed to pass the"
-            "\n\t\tspecified data quality criteria. This includes the"
-            "\n\t\tpresence of gaps or overlaps, or the data not"
-            "\n\t\tspanning the full time window."
-        )
+    def __init__(self):
+        super().__init__()
 
 
-class DataGapException(Exception):
+class DataGapException(QMigrateError):
     """
     Custom exception to handle case when no data is found for the selected stations for
     a given timestep.
     """
 
-    def __init__(self):
-        super().__init__(
-            "No data present in the archive for theselected stations for this time "
-            "window."
-        )
+    MESSAGE = (
+        "No data present in the archive for theselected stations for this time window."
+    )
+    # Additional message printed to log
+    msg = (
+        "\t\tNo data for the selected stations was found in the"
+        "\n\t\tarchive for this time window."
+    )
 
-        # Additional message printed to log
-        self.msg = (
-            "\t\tNo data for the selected stations was found in the"
-            "\n\t\tarchive for this time window."
-        )
+    def __init__(self):
+        super().__init__()
 
 
-class ChannelNameException(Exception):
+class ChannelNameException(QMigrateError):
     """
     Custom exception to handle case when waveform data header has channel names which do
     not conform to the IRIS SEED standard.
     """
 
+    MESSAGE = (
+        "Channel name header does not conform to\nthe IRIS SEED standard - 3 "
+        "characters; ending in 'Z' for\nvertical and ending either 'E' & 'N' or "
+        "'1' & '2' for\nhorizontal components.\n    Working on trace: {}"
+    )
+
     def __init__(self, trace):
-        super().__init__(
-            "Channel name header does not conform to\nthe IRIS SEED standard - 3 "
-            "characters; ending in 'Z' for\nvertical and ending either 'E' & 'N' or "
-            f"'1' & '2' for\nhorizontal components.\n    Working on trace: {trace}"
-        )
+        super().__init__(trace)
 
 
-class NoOnsetPeak(Exception):
+class NoOnsetPeak(QMigrateError):
     """
     Custom exception to handle case when no values in the onset function exceed the
     threshold used for picking.
     """
 
+    MESSAGE = "\t\t    No onset signal exceeding pick threshold ({:5.3f}) - continuing."
+
     def __init__(self, pick_threshold):
-        self.msg = (
-            "\t\t    No onset signal exceeding pick threshold "
-            f"({pick_threshold:5.3f}) - continuing."
-        )
-        super().__init__(self.msg)
+        super().__init__(pick_threshold)
+
+        # Additional message printed to log
+        self.msg = str(self)
 
 
-class BadUpfactorException(Exception):
+class BadUpfactorException(QMigrateError):
     """
     Custom exception to handle case when the chosen upfactor does not create a trace
     with a sampling rate that can be decimated to the target sampling rate.
     """
 
+    MESSAGE = (
+        "Chosen upfactor cannot be decimated to\ntarget sampling rate."
+        "\n    Working on trace: {}"
+    )
+
     def __init__(self, trace):
-        super().__init__(
-            "Chosen upfactor cannot be decimated to\ntarget sampling rate."
-            f"\n    Working on trace: {trace}"
-        )
+        super().__init__(trace)
 
 
-class OnsetTypeError(Exception):
+class OnsetTypeError(QMigrateError):
     """
     Custom exception to handle case when the onset object passed to QuakeScan is not of
     the default type defined in QuakeMigrate.
     """
 
+    MESSAGE = (
+        "The Onset object you have created does not inherit from the required base "
+        "class - see manual."
+    )
+
     def __init__(self):
-        super().__init__(
-            "The Onset object you have created does not inherit from the required base "
-            "class - see manual."
-        )
+        super().__init__()
 
 
-class PickerTypeError(Exception):
+class PickerTypeError(QMigrateError):
     """
     Custom exception to handle case when the phase picker object passed to QuakeScan is
     not of the default type defined in QuakeMigrate.
     """
 
+    MESSAGE = (
+        "The PhasePicker object you have created does not inherit from the "
+        "required base class - see manual."
+    )
+
     def __init__(self):
-        super().__init__(
-            "The PhasePicker object you have created does not inherit from the "
-            "required base class - see manual."
-        )
+        super().__init__()
 
 
-class LUTPhasesException(Exception):
+class LUTPhasesException(QMigrateError):
     """
     Custom exception to handle the case when the look-up table does not contain the
     traveltimes for the phases necessary for a given function.
     """
 
+    MESSAGE = "{}"
+
     def __init__(self, message):
         super().__init__(message)
 
 
-class PickOrderException(Exception):
+class PickOrderException(QMigrateError):
     """
     Custom exception to handle the case when the pick for the P phase is later than the
     pick for the S phase.
     """
 
+    MESSAGE = (
+        "The P-phase arrival-time pick is later than the S-phase arrival pick! "
+        "Something has gone wrong.\nEvent: {}, station: {}, p_pick: {}, s_pick: {}. "
+        "There is probably a bug with the picker."
+    )
+
     def __init__(self, event_uid, station, p_pick, s_pick):
-        super().__init__(
-            "The P-phase arrival-time pick is later than the S-phase arrival pick! "
-            f"Something has gone wrong.\nEvent: {event_uid}, station: {station}, "
-            f"p_pick: {p_pick}, s_pick: {s_pick}. There is probably a bug with the "
-            "picker."
-        )
+        super().__init__(event_uid, station, p_pick, s_pick)
 
 
-class MagsTypeError(Exception):
+class MagsTypeError(QMigrateError):
     """
     Custom exception to handle case when an object has been provided to calculate
     magnitudes during locate, but it isn't supported.
     """
 
+    MESSAGE = (
+        "The Mags object you have specified is not supported: currently only "
+        "`quakemigrate.signal.local_mag.LocalMag` - see manual."
+    )
+
     def __init__(self):
-        super().__init__(
-            "The Mags object you have specified is not supported: currently only "
-            "`quakemigrate.signal.local_mag.LocalMag` - see manual."
-        )
+        super().__init__()
 
 
-class NoTriggerFilesFound(Exception):
+class NoTriggerFilesFound(QMigrateError):
     """
     Custom exception to handle case when no trigger files are found during locate. This
     can occur for one of two reasons - an entirely invalid time period was used (i.e.
@@ -896,14 +1125,16 @@ class NoTriggerFilesFound(Exception):
     TriggeredEvents.csv files) or an invalid run name was provided.
     """
 
+    MESSAGE = (
+        "Double check you have supplied a valid run name and a time period for "
+        "which you have run detect."
+    )
+
     def __init__(self):
-        super().__init__(
-            "Double check you have supplied a valid run name and a time period for "
-            "which you have run detect."
-        )
+        super().__init__()
 
 
-class ResponseNotFoundError(Exception):
+class ResponseNotFoundError(QMigrateError):
     """
     Custom exception to handle the case where the provided response inventory doesn't
     contain the response information for a trace.
@@ -917,11 +1148,13 @@ class ResponseNotFoundError(Exception):
 
     """
 
+    MESSAGE = "{} -- skipping {}"
+
     def __init__(self, e, tr_id):
-        super().__init__(f"{e} -- skipping {tr_id}")
+        super().__init__(e, tr_id)
 
 
-class ResponseRemovalError(Exception):
+class ResponseRemovalError(QMigrateError):
     """
     Custom exception to handle the case where the response removal was not successful.
 
@@ -934,11 +1167,13 @@ class ResponseRemovalError(Exception):
 
     """
 
+    MESSAGE = "{} -- skipping {}"
+
     def __init__(self, e, tr_id):
-        super().__init__(f"{e} -- skipping {tr_id}")
+        super().__init__(e, tr_id)
 
 
-class NyquistException(Exception):
+class NyquistException(QMigrateError):
     """
     Custom exception to handle the case where the specified filter has a lowpass corner
     above the signal Nyquist frequency.
@@ -954,19 +1189,23 @@ class NyquistException(Exception):
 
     """
 
+    MESSAGE = (
+        "    Selected bandpass_highcut {} Hz is at or above the Nyquist "
+        "frequency ({} Hz) for trace {}. "
+    )
+
     def __init__(self, freqmax, f_nyquist, tr_id):
-        super().__init__(
-            f"    Selected bandpass_highcut {freqmax} Hz is at or above the Nyquist "
-            f"frequency ({f_nyquist} Hz) for trace {tr_id}. "
-        )
+        super().__init__(freqmax, f_nyquist, tr_id)
 
 
-class PeakToTroughError(Exception):
+class PeakToTroughError(QMigrateError):
     """
     Custom exception to handle case when amplitude._peak_to_trough_amplitude encounters
     an anomalous set of peaks and troughs, so can't calculate an amplitude.
     """
 
+    MESSAGE = "{}"
+
     def __init__(self, err):
         super().__init__(err)
 
@@ -974,31 +1213,37 @@ class PeakToTroughError(Exception):
         self.msg = err
 
 
-class TimeSpanException(Exception):
+class TimeSpanException(QMigrateError):
     """
     Custom exception to handle case when the user has submitted a start time that is
     after the end time.
     """
 
+    MESSAGE = "The start time specified is after the end time."
+
     def __init__(self):
-        super().__init__("The start time specified is after the end time.")
+        super().__init__()
 
 
-class InvalidTriggerThresholdMethodException(Exception):
+class InvalidTriggerThresholdMethodException(QMigrateError):
     """
     Custom exception to handle case when the user has not selected a valid trigger
     threshold method.
     """
 
+    MESSAGE = "Only 'static' or 'dynamic' thresholds are supported."
+
     def __init__(self):
-        super().__init__("Only 'static' or 'dynamic' thresholds are supported.")
+        super().__init__()
 
 
-class InvalidPickThresholdMethodException(Exception):
+class InvalidPickThresholdMethodException(QMigrateError):
     """
     Custom exception to handle case when the user has not selected a valid pick
     threshold method.
     """
 
+    MESSAGE = "Only 'percentile' or 'MAD' thresholds are supported."
+
     def __init__(self):
-        super().__init__("Only 'percentile' or 'MAD' thresholds are supported.")
+        super().__init__()
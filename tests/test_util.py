@@ -11,6 +11,9 @@ quakemigrate.util.
 
 """
 
+import logging
+import pathlib
+import tempfile
 import unittest
 from copy import deepcopy
 
@@ -59,6 +62,152 @@ class TestUtil(unittest.TestCase):
 
         self.assertTrue(st_merged == Stream(st[2]))
 
+    def test_logger(self):
+        """Test repeat calls to logger replace, rather than add to, the handlers."""
+
+        root = logging.getLogger()
+        level, n_handlers = root.level, len(root.handlers)
+        with tempfile.TemporaryDirectory() as tmpdir:
+            tmpdir = pathlib.Path(tmpdir)
+            try:
+                util.logger(tmpdir / "first" / "run", True)
+                logging.info("First message")
+                util.logger(tmpdir / "second" / "run", True)
+                logging.info("Second message")
+
+                # Only the file and stdout handlers from the latest call should remain
+                self.assertEqual(len(root.handlers), n_handlers + 2)
+                for handler in util._log_handlers:
+                    handler.flush()
+                (first,) = (tmpdir / "first").glob("*.log")
+                (second,) = (tmpdir / "second").glob("*.log")
+                self.assertNotIn("Second message", first.read_text())
+                self.assertIn("Second message", second.read_text())
+            finally:
+                for handler in util._log_handlers:
+                    root.removeHandler(handler)
+                    handler.close()
+                util._log_handlers.clear()
+                root.setLevel(level)
+
+    def test_exceptions(self):
+        """Test custom exceptions format their messages and check their arguments."""
+
+        e = util.InvalidVelocityModelHeader("Vp")
+        self.assertIsInstance(e, util.QMigrateError)
+        self.assertEqual(str(e), "Must include at least 'Vp' in header.")
+
+        e = util.NyquistException(freqmax=60.0, f_nyquist=50.0, tr_id="Z7.FLUR..HHE")
+        self.assertIn("Z7.FLUR..HHE", str(e))
+
+        with self.assertRaises(TypeError):
+            util.InvalidVelocityModelHeader()
+        with self.assertRaises(TypeError):
+            util.TimeSpanException("unexpected")
+
+    def test_time2sample(self):
+        """Test conversion of scalar and array times to samples."""
+
+        times = [0.0, 0.024, 0.025, 1.234, 2.5]
+        expected = [round(t * 100) for t in times]
+
+        self.assertEqual([util.time2sample(t, 100) for t in times], expected)
+        self.assertTrue((util.time2sample(times, 100.0) == expected).all())
+
+    def test_trim2sample(self):
+        """Test trimming of scalar and array times to an integer number of samples."""
+
+        times = [0.0, 0.0101, 0.25, 1.2341]
+        trimmed = [util.trim2sample(t, 50) for t in times]
+
+        self.assertEqual(trimmed, [0.0, 0.02, 0.26, 1.24])
+        self.assertTrue(np.allclose(util.trim2sample(times, 50), trimmed))
+
+        # Sub-millisecond sample intervals should be preserved, unless requested
+        self.assertEqual(util.trim2sample(0.0012, 2000), 0.0015)
+        self.assertEqual(util.trim2sample(0.0012, 2000, quantize_ms=True), 0.001)
+
+    def test_squared_euclidean(self):
+        """Test squared Euclidean distances for single vectors and in batch."""
+
+        rand = np.random.RandomState(815)
+        X = rand.rand(10, 3).astype(np.float32)
+        y = rand.rand(3).astype(np.float32)
+        expected = np.sum((X - y) ** 2, axis=1)
+
+        self.assertTrue(np.isclose(util.squared_euclidean(X[0], y), expected[0]))
+        self.assertTrue(np.allclose(util.squared_euclidean_batch(X, y), expected))
+
+    def test_gaussian_1d(self):
+        """Test 1-D Gaussian against the analytical expression."""
+
+        x = np.linspace(-2.0, 3.0, 51)
+        a, b, c = 2.5, 0.4, 0.7
+        expected = a * np.exp(-((x - b) ** 2) / (2 * c**2))
+
+        self.assertTrue(np.allclose(util.gaussian_1d(x, a, b, c), expected))
+
+        # Input precision and scalar input should be preserved
+        f32 = util.gaussian_1d(x.astype(np.float32), a, b, c)
+        self.assertEqual(f32.dtype, np.float32)
+        self.assertTrue(np.isscalar(util.gaussian_1d(0.5, a, b, c)))
+
+        # Zero width should follow NumPy's division semantics, not raise
+        with np.errstate(divide="ignore", invalid="ignore"):
+            f0 = util.gaussian_1d(np.arange(-2.0, 3.0), 1.0, 0.0, 0)
+        self.assertTrue(np.array_equal(f0, [0, 0, np.nan, 0, 0], equal_nan=True))
+
+        # Array parameters should broadcast against x
+        means = np.array([0.0, 1.0])
+        f = util.gaussian_1d(x[:, None], a, means, c)
+        self.assertEqual(f.shape, (len(x), 2))
+        for i, mean in enumerate(means):
+            self.assertTrue(np.allclose(f[:, i], util.gaussian_1d(x, a, mean, c)))
+
+    def test_gaussian_3d(self):
+        """Test 3-D Gaussian against an explicit evaluation on a full grid."""
+
+        nx, ny, nz = 11, 8, 5
+        for sgm in [0.8, (1.0, 2.5, 0.6)]:
+            sx, sy, sz = np.broadcast_to(sgm, 3)
+            ix, iy, iz = np.meshgrid(
+                np.linspace(-(nx - 1) / 2, (nx - 1) / 2, nx),
+                np.linspace(-(ny - 1) / 2, (ny - 1) / 2, ny),
+                np.linspace(-(nz - 1) / 2, (nz - 1) / 2, nz),
+                indexing="ij",
+            )
+            expected = np.exp(
+                -(ix * ix) / (2 * sx * sx)
+                - (iy * iy) / (2 * sy * sy)
+                - (iz * iz) / (2 * sz * sz)
+            )
+
+            f = util.gaussian_3d(nx, ny, nz, sgm)
+
+            self.assertEqual(f.shape, (nx, ny, nz))
+            self.assertEqual(f.dtype, np.float32)
+            self.assertTrue(np.allclose(f, expected))
+
+            # Repeat calls should return the cached, read-only, kernel
+            self.assertIs(util.gaussian_3d(nx, ny, nz, sgm).base, f.base)
+            self.assertFalse(f.flags.writeable)
+            with self.assertRaises(ValueError):
+                f.flags.writeable = True
+
+    def test_gaussian_kernels_1d(self):
+        """Test 1-D kernels are normalised and separate the 3-D Gaussian."""
+
+        nx, ny, nz, sgm = 11, 8, 5, (1.0, 2.5, 0.6)
+        gx, gy, gz = util.gaussian_kernels_1d(nx, ny, nz, sgm)
+
+        for g, n in zip((gx, gy, gz), (nx, ny, nz)):
+            self.assertEqual(g.shape, (n,))
+            self.assertTrue(np.isclose(g.sum(), 1.0))
+
+        f = util.gaussian_3d(nx, ny, nz, sgm)
+        outer = gx[:, None, None] * gy[None, :, None] * gz[None, None, :]
+        self.assertTrue(np.allclose(outer / outer.max(), f / f.max()))
+
 
 if __name__ == "__main__":
     unittest.main()